@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .agents.gemini_base import get_gemini_model, get_vertex_hedge_region
+from .env_flags import env_flag
+from .executor import run_cpu
+from .run_context import run_within_deadline
+from .scheduler import lane_for_stage, scheduler
+
+
+def is_hedging_enabled() -> bool:
+    return env_flag("AGUI_HEDGE_ENABLED", False)
+
+
+def get_hedge_percentile() -> float:
+    return float(os.environ.get("AGUI_HEDGE_PERCENTILE", "95"))
+
+
+def get_hedge_default_delay() -> float:
+    return float(os.environ.get("AGUI_HEDGE_DEFAULT_DELAY_SECONDS", "10"))
+
+
+def get_hedge_max_rate() -> float:
+    return float(os.environ.get("AGUI_HEDGE_MAX_RATE", "0.1"))
+
+
+def get_ollama_hedge_base_url() -> str | None:
+    return os.environ.get("OLLAMA_HEDGE_BASE_URL") or None
+
+
+def is_single_flight_enabled() -> bool:
+    return env_flag("AGUI_SINGLE_FLIGHT", True)
+
+
+_MIN_LATENCY_SAMPLES = 20
+_LATENCY_WINDOW = 200
+_OFFLOAD_HASH_CHARS = 256 * 1024
+
+
+class HedgeStats:
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.calls = 0
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+        self.primary_wins = 0
+        self.budget_denied = 0
+        self.both_failed = 0
+
+    def hedge_delay(self) -> float:
+        if len(self.latencies) < _MIN_LATENCY_SAMPLES:
+            return get_hedge_default_delay()
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * get_hedge_percentile() / 100.0))
+        return ordered[index]
+
+    def allow_hedge(self) -> bool:
+        # Budget cap: hedges may never exceed the configured share of calls for this stage.
+        if (self.hedges_sent + 1) > get_hedge_max_rate() * self.calls:
+            self.budget_denied += 1
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "calls": self.calls,
+            "hedges_sent": self.hedges_sent,
+            "hedge_rate": self.hedges_sent / self.calls if self.calls else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "primary_wins": self.primary_wins,
+            "budget_denied": self.budget_denied,
+            "both_failed": self.both_failed,
+            "hedge_delay_seconds": self.hedge_delay(),
+        }
+
+
+_hedge_stats: Dict[str, HedgeStats] = {}
+_hedge_models: Dict[tuple, Any] = {}
+
+
+def _stats_for(stage: str) -> HedgeStats:
+    if stage not in _hedge_stats:
+        _hedge_stats[stage] = HedgeStats(stage)
+    return _hedge_stats[stage]
+
+
+def get_hedge_stats() -> List[Dict[str, Any]]:
+    return [stats.stats() for stats in _hedge_stats.values()]
+
+
+def _build_hedge_model(model) -> Optional[Any]:
+    kind = type(model).__name__
+    if kind.startswith("Gemini") or kind.startswith("Google"):
+        region = get_vertex_hedge_region()
+        return get_gemini_model(region) if region else None
+    if kind.startswith("OpenAI"):
+        base_url = get_ollama_hedge_base_url()
+        if not base_url:
+            return None
+        from pydantic_ai.models.openai import OpenAIChatModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+
+        return OpenAIChatModel(
+            model_name=model.model_name,
+            provider=OpenAIProvider(base_url=base_url, api_key='ollama'),
+        )
+    return None
+
+
+def _hedge_model_for(agent) -> Optional[Any]:
+    model = getattr(agent, "model", None)
+    if model is None:
+        return None
+    # Gemini agents are rebuilt per node call, so key by model identity rather than instance.
+    key = (type(model).__name__, getattr(model, "model_name", None))
+    if key not in _hedge_models:
+        _hedge_models[key] = _build_hedge_model(model)
+    return _hedge_models[key]
+
+
+async def _cancel(task: asyncio.Task) -> None:
+    if not task.done():
+        task.cancel()
+        try:
+            await task
+        except BaseException:  # pylint: disable=broad-except
+            pass
+
+
+async def _run_hedged(agent, prompt: str, stats: HedgeStats):
+    primary = asyncio.ensure_future(agent.run(prompt))
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=stats.hedge_delay())
+        if done:
+            return primary.result()
+
+        hedge_model = _hedge_model_for(agent)
+        if hedge_model is None or not stats.allow_hedge():
+            return await primary
+
+        stats.hedges_sent += 1
+        hedge = asyncio.ensure_future(agent.run(prompt, model=hedge_model))
+        try:
+            pending = {primary, hedge}
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    winner = succeeded[0]
+                    if winner is hedge:
+                        stats.hedge_wins += 1
+                    else:
+                        stats.primary_wins += 1
+                    return winner.result()
+                if not pending:
+                    stats.both_failed += 1
+                    return done.pop().result()
+        finally:
+            await _cancel(hedge)
+    finally:
+        await _cancel(primary)
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+_flights: Dict[str, _Flight] = {}
+_single_flight_stats = {"leaders": 0, "coalesced": 0}
+
+
+def get_single_flight_stats() -> Dict[str, Any]:
+    total = _single_flight_stats["leaders"] + _single_flight_stats["coalesced"]
+    return {
+        **_single_flight_stats,
+        "in_flight": len(_flights),
+        "coalesced_rate": _single_flight_stats["coalesced"] / total if total else 0.0,
+    }
+
+
+def _digest(stage: str, model_name: str, prompt: str) -> str:
+    return hashlib.sha256(f"{stage}\x00{model_name}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+async def _flight_key(agent, prompt: str, stage: str, dedupe_key: Optional[str] = None) -> str:
+    model_name = str(getattr(getattr(agent, "model", None), "model_name", type(agent).__name__))
+    if dedupe_key is not None:
+        return _digest(stage, model_name, dedupe_key)
+    if len(prompt) > _OFFLOAD_HASH_CHARS:
+        return await run_cpu(_digest, stage, model_name, prompt)
+    return _digest(stage, model_name, prompt)
+
+
+def _current_thread_id() -> Optional[str]:
+    try:
+        from langchain_core.runnables.config import var_child_runnable_config
+    except ImportError:
+        return None
+    config = var_child_runnable_config.get() or {}
+    thread_id = (config.get("configurable") or {}).get("thread_id")
+    return str(thread_id) if thread_id is not None else None
+
+
+async def _call_agent(agent, prompt: str, stage: str):
+    # Cost in roughly thousand-token units so large documents use up their thread's fair share faster.
+    cost = 1.0 + len(prompt) / 4000.0
+    async with scheduler.slot(lane_for_stage(stage, len(prompt)), _current_thread_id(), cost):
+        stats = _stats_for(stage)
+        stats.calls += 1
+        started = time.perf_counter()
+        if is_hedging_enabled():
+            result = await _run_hedged(agent, prompt, stats)
+        else:
+            result = await agent.run(prompt)
+        stats.latencies.append(time.perf_counter() - started)
+        return result
+
+
+async def _single_flight(key: str, agent, prompt: str, stage: str):
+    flight = _flights.get(key)
+    if flight is not None and (flight.task.cancelled() or flight.task.cancelling()):
+        flight = None
+    if flight is None:
+        flight = _Flight(asyncio.ensure_future(_call_agent(agent, prompt, stage)))
+        _flights[key] = flight
+        flight.task.add_done_callback(lambda _: _flights.pop(key, None) if _flights.get(key) is flight else None)
+        _single_flight_stats["leaders"] += 1
+    else:
+        _single_flight_stats["coalesced"] += 1
+
+    flight.waiters += 1
+    try:
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        # The shared call only stops when every run waiting on it has gone away.
+        if flight.waiters == 0 and not flight.task.done():
+            if _flights.get(key) is flight:
+                del _flights[key]
+            flight.task.cancel()
+
+
+async def run_agent(agent, prompt: str, *, stage: str, dedupe_key: Optional[str] = None):
+    """Run ``agent`` on ``prompt``; every node's LLM call goes through here.
+
+    ``dedupe_key`` replaces the prompt as the single-flight identity, e.g. so the same document
+    uploaded under two file ids coalesces.
+    """
+    if not is_single_flight_enabled():
+        return await run_within_deadline(_call_agent(agent, prompt, stage), stage)
+    key = await _flight_key(agent, prompt, stage, dedupe_key)
+    return await run_within_deadline(_single_flight(key, agent, prompt, stage), stage)
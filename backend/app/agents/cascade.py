@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, List, Tuple
+
+from ..env_flags import env_flag
+
+_KEY_VALUE_RE = re.compile(r"^\s*([A-Za-z][\w .'/()-]{0,60}?)\s*[:=\-]\s+(.+?)\s*$")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_ground_cascade_enabled() -> bool:
+    return env_flag("AGUI_GROUND_CASCADE", False)
+
+
+def get_ground_cascade_threshold() -> float:
+    return float(os.environ.get("AGUI_GROUND_CASCADE_THRESHOLD", "0.8"))
+
+
+def get_ground_cascade_max_chars() -> int:
+    return int(os.environ.get("AGUI_GROUND_CASCADE_MAX_CHARS", "4000"))
+
+
+def get_summary_cascade_threshold() -> float:
+    return float(os.environ.get("AGUI_SUMMARY_CASCADE_THRESHOLD", "0.6"))
+
+
+class CascadeStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.attempts = 0
+        self.accepted = 0
+        self.escalated = 0
+        self.confidence_total = 0.0
+
+    def record(self, confidence: float, accepted: bool) -> None:
+        self.attempts += 1
+        self.confidence_total += confidence
+        if accepted:
+            self.accepted += 1
+        else:
+            self.escalated += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "attempts": self.attempts,
+            "accepted": self.accepted,
+            "escalated": self.escalated,
+            "escalation_rate": self.escalated / self.attempts if self.attempts else 0.0,
+            "avg_confidence": self.confidence_total / self.attempts if self.attempts else 0.0,
+        }
+
+
+grounding_cascade_stats = CascadeStats("grounding")
+summary_cascade_stats = CascadeStats("summary")
+
+
+def get_cascade_stats() -> List[Dict[str, Any]]:
+    return [grounding_cascade_stats.stats(), summary_cascade_stats.stats()]
+
+
+def rule_based_ground(raw_text: str) -> Tuple[Dict[str, Any], float]:
+    """Ground ``Label: value`` style form text locally; confidence is the share of lines understood."""
+    lines = [" ".join(line.split()) for line in raw_text.splitlines()]
+    lines = [line for line in lines if line]
+    if not lines or len(raw_text) > get_ground_cascade_max_chars():
+        return {"normalized_text": " ".join(lines), "entities": [], "notes": None}, 0.0
+
+    entities = []
+    for line in lines:
+        match = _KEY_VALUE_RE.match(line)
+        if match:
+            entities.append({"key": match.group(1).strip(), "value": match.group(2).strip()})
+
+    confidence = len(entities) / len(lines)
+    payload = {
+        "normalized_text": "\n".join(lines),
+        "entities": entities,
+        "notes": "Grounded locally by rule-based grounder.",
+    }
+    return payload, confidence
+
+
+def score_summary(source_text: str, summary: str) -> float:
+    """Cheap validation score for a small-model summary: shape, length and lexical grounding in the source."""
+    summary_words = _WORD_RE.findall(summary.lower())
+    if not summary_words:
+        return 0.0
+    source_words = set(_WORD_RE.findall(source_text.lower()))
+    overlap = sum(1 for word in summary_words if word in source_words) / len(summary_words)
+
+    sentences = [part for part in re.split(r"(?<=[.!?])\s+", summary.strip()) if part]
+    shape = 1.0 if 1 <= len(sentences) <= 3 else 0.5
+    length = 1.0 if len(summary_words) <= max(12, len(source_text.split())) else 0.3
+    return overlap * shape * length
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from pydantic_ai import Agent
+
+from ..env_flags import env_flag
+from ..schemas.state import FusedFileOutput
+from .gemini_base import get_gemini_agent
+
+
+FUSED_INSTRUCTIONS = (
+    "You are a single-pass handwritten form processor. "
+    "Given a document (image/tiff/pdf) encoded as base64 and metadata, do all of the following in one response: "
+    "1) assess skewness, blur, and lighting variance and list quality issues; "
+    "2) estimate handwriting bounding boxes in total and per page; "
+    "3) extract the handwritten text and page count; "
+    "4) normalize and structure the extracted text, returning concise normalized text and key-value entities. "
+    "Fill every section of the output schema."
+)
+
+
+def is_fused_mode_enabled() -> bool:
+    return env_flag("AGUI_FILE_FUSED", False)
+
+
+def get_fused_max_bytes() -> int:
+    return int(os.environ.get("AGUI_FILE_FUSED_MAX_BYTES", str(2 * 1024 * 1024)))
+
+
+def get_fused_agent() -> Optional[Agent]:
+    return get_gemini_agent(FUSED_INSTRUCTIONS, output_type=FusedFileOutput)
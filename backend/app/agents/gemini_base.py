@@ -22,7 +22,11 @@ def get_vertex_project_id() -> str | None:
     )
 
 
-def get_gemini_agent(instructions: str, output_type=None) -> Optional[Agent]:
+def get_vertex_hedge_region() -> str | None:
+    return os.environ.get("VERTEX_HEDGE_REGION") or None
+
+
+def get_gemini_model(region: str | None = None):
     try:
         from pydantic_ai.models.gemini import GeminiModel
         from pydantic_ai.providers.google_vertex import GoogleVertexProvider
@@ -31,9 +35,15 @@ def get_gemini_agent(instructions: str, output_type=None) -> Optional[Agent]:
 
     provider = GoogleVertexProvider(
         project_id=get_vertex_project_id(),
-        region=get_vertex_region(),
+        region=region or get_vertex_region(),
     )
-    model = GeminiModel(get_gemini_model_name(), provider=provider)
+    return GeminiModel(get_gemini_model_name(), provider=provider)
+
+
+def get_gemini_agent(instructions: str, output_type=None) -> Optional[Agent]:
+    model = get_gemini_model()
+    if model is None:
+        return None
 
     return Agent(
         model,
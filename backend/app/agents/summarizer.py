@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+import os
+
 from openai import AsyncOpenAI
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIChatModel
@@ -19,8 +23,35 @@ from ..schemas.state import SummaryOutput
 # model = GoogleModel('gemini-3-pro-preview', provider=provider)
 # agent = Agent(model)
 
+SUMMARIZER_MODEL_NAME = 'llama3.1'
+SUMMARIZER_INSTRUCTIONS = "Summarize the following text in 1-3 sentences."
+CHUNK_SUMMARY_INSTRUCTIONS = (
+    "Summarize this excerpt of a longer document in 1-3 sentences and list its main topics as key points."
+)
+REDUCE_SUMMARY_INSTRUCTIONS = (
+    "You are given partial summaries and key points from consecutive excerpts of one document. "
+    "Combine them into a single 1-3 sentence summary and a deduplicated list of the main topics."
+)
+
+
+def get_long_input_tokens() -> int:
+    return int(os.environ.get("AGUI_SUMMARY_LONG_INPUT_TOKENS", "3000"))
+
+
+def get_chunk_tokens() -> int:
+    return int(os.environ.get("AGUI_SUMMARY_CHUNK_TOKENS", "1500"))
+
+
+def get_summary_parallelism() -> int:
+    return max(1, int(os.environ.get("AGUI_SUMMARY_PARALLELISM", "4")))
+
+
+def get_small_summarizer_model_name() -> str | None:
+    return os.environ.get("AGUI_SUMMARY_SMALL_MODEL") or None
+
+
 model = OpenAIChatModel(
-            model_name='llama3.1', 
+            model_name=SUMMARIZER_MODEL_NAME, 
             provider=OpenAIProvider(
                 base_url='http://localhost:11434/v1', 
                 api_key='ollama'
@@ -29,9 +60,51 @@ model = OpenAIChatModel(
 
 summarizer_agent = Agent(
     model,
-    instructions="Summarize the following text in 1-3 sentences.",
+    instructions=SUMMARIZER_INSTRUCTIONS,
+    model_settings={"temperature": 0},
+    retries=3,
+)
+
+chunk_summarizer_agent = Agent(
+    model,
+    instructions=CHUNK_SUMMARY_INSTRUCTIONS,
+    output_type=SummaryOutput,
+    model_settings={"temperature": 0},
+    retries=3,
+    output_retries=3,
+)
+
+summary_reduce_agent = Agent(
+    model,
+    instructions=REDUCE_SUMMARY_INSTRUCTIONS,
+    output_type=SummaryOutput,
     model_settings={"temperature": 0},
     retries=3,
+    output_retries=3,
 )
 
+_small_summarizer_agent = None
+
+
+def get_small_summarizer_agent() -> Agent | None:
+    global _small_summarizer_agent
+    model_name = get_small_summarizer_model_name()
+    if not model_name:
+        return None
+    if _small_summarizer_agent is None:
+        small_model = OpenAIChatModel(
+            model_name=model_name,
+            provider=OpenAIProvider(
+                base_url='http://localhost:11434/v1',
+                api_key='ollama'
+            )
+        )
+        _small_summarizer_agent = Agent(
+            small_model,
+            instructions=SUMMARIZER_INSTRUCTIONS,
+            model_settings={"temperature": 0},
+            retries=1,
+        )
+    return _small_summarizer_agent
+
 #  result_type=CountOutput, system_prompt="Count words in the text."
@@ -19,8 +19,11 @@ from ..schemas.state import SummaryOutput
 # model = GoogleModel('gemini-3-pro-preview', provider=provider)
 # agent = Agent(model)
 
+TRANSLATOR_MODEL_NAME = 'llama3.1'
+TRANSLATOR_INSTRUCTIONS = "Translate the following text to Hindi."
+
 model = OpenAIChatModel(
-            model_name='llama3.1', 
+            model_name=TRANSLATOR_MODEL_NAME, 
             provider=OpenAIProvider(
                 base_url='http://localhost:11434/v1', 
                 api_key='ollama'
@@ -29,7 +32,7 @@ model = OpenAIChatModel(
 
 translator_agent = Agent(
     model,
-    instructions="Translate the following text to Hindi.",
+    instructions=TRANSLATOR_INSTRUCTIONS,
     model_settings={"temperature": 0},
     retries=3,
 )
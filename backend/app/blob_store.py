@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .executor import run_io
+
+BLOB_DIR = Path(os.environ.get("AGUI_BLOB_DIR", Path(__file__).resolve().parent / "blobs"))
+BLOB_DIR.mkdir(parents=True, exist_ok=True)
+
+BLOB_INLINE_MAX_BYTES = int(os.environ.get("AGUI_BLOB_INLINE_MAX_BYTES", str(16 * 1024)))
+
+_BLOB_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _blob_path(blob_id: str) -> Path:
+    return BLOB_DIR / blob_id[:2] / blob_id[2:4] / blob_id
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("blob_ref"), str) and "encoding" in value
+
+
+def put_blob(value: Any) -> Dict[str, Any]:
+    if isinstance(value, str):
+        encoding, data = "text", value.encode("utf-8")
+    else:
+        encoding, data = "json", json.dumps(value).encode("utf-8")
+    blob_id = hashlib.sha256(data).hexdigest()
+    path = _blob_path(blob_id)
+    try:
+        # Reusing an existing blob refreshes its age so the janitor does not prune a freshly handed-out ref.
+        os.utime(path)
+        return {"blob_ref": blob_id, "size": len(data), "encoding": encoding}
+    except FileNotFoundError:
+        pass
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent writers of the same blob each get their own temp file; content is identical either way.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{blob_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except OSError:
+            if not path.exists():
+                raise
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    return {"blob_ref": blob_id, "size": len(data), "encoding": encoding}
+
+
+def get_blob(ref: Dict[str, Any]) -> Any:
+    blob_id = ref.get("blob_ref")
+    if not isinstance(blob_id, str) or not _BLOB_ID_RE.match(blob_id):
+        raise KeyError("Invalid blob reference")
+    path = _blob_path(blob_id)
+    data = path.read_bytes()
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    if ref.get("encoding") == "json":
+        return json.loads(data)
+    return data.decode("utf-8")
+
+
+def externalize(payload: Optional[Dict[str, Any]], keys: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+    """Replace large top-level values of ``payload`` with blob handles; small values stay inline."""
+    if not isinstance(payload, dict):
+        return payload
+    result = dict(payload)
+    for key in keys if keys is not None else payload.keys():
+        value = result.get(key)
+        if value is None or is_blob_ref(value):
+            continue
+        if isinstance(value, str):
+            size = len(value)
+        elif isinstance(value, (dict, list)):
+            size = len(json.dumps(value))
+        else:
+            continue
+        if size > BLOB_INLINE_MAX_BYTES:
+            result[key] = put_blob(value)
+    return result
+
+
+def resolve(payload: Any) -> Any:
+    if is_blob_ref(payload):
+        return get_blob(payload)
+    if isinstance(payload, dict):
+        return {key: get_blob(value) if is_blob_ref(value) else value for key, value in payload.items()}
+    return payload
+
+
+def prune_blobs(max_age_seconds: float, now: Optional[float] = None) -> int:
+    if max_age_seconds <= 0:
+        return 0
+    now = time.time() if now is None else now
+    pruned = 0
+    for path in BLOB_DIR.glob("*/*/*"):
+        try:
+            if now - path.stat().st_mtime > max_age_seconds:
+                path.unlink()
+                pruned += 1
+        except OSError:
+            continue
+    return pruned
+
+
+async def aexternalize(payload: Optional[Dict[str, Any]], keys: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+    return await run_io(externalize, payload, keys)
+
+
+async def aresolve(payload: Any) -> Any:
+    return await run_io(resolve, payload)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from .env_flags import env_flag
+
+_DATE_RE = re.compile(
+    r"\b(?:\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}|\d{4}-\d{2}-\d{2}"
+    r"|\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+\d{2,4})\b",
+    re.IGNORECASE,
+)
+_PHONE_RE = re.compile(r"(?<![\w+])\+?\(?\d[\d\s()-]{5,18}\d(?!\w)")
+_EMAIL_RE = re.compile(r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)+\b")
+_POSTAL_RE = re.compile(r"\b(?:\d{6}|\d{3}\s\d{3}|\d{5}(?:-\d{4})?)\b")
+_AMOUNT_RE = re.compile(r"(?:(?:rs\.?|inr|usd|\$|₹|€|£)\s*)?\d{1,3}(?:[,\s]\d{2,3})*(?:\.\d{1,2})?(?:\s*/-)?", re.IGNORECASE)
+_PAN_RE = re.compile(r"\b[A-Z]{5}\d{4}[A-Z]\b")
+_AADHAAR_RE = re.compile(r"\b\d{4}\s?\d{4}\s?\d{4}\b")
+_ID_RE = re.compile(r"\b(?=[A-Z0-9-]*\d)[A-Z0-9][A-Z0-9-]{4,19}\b", re.IGNORECASE)
+
+_TYPE_PATTERNS: Dict[str, Pattern[str]] = {
+    "date": _DATE_RE,
+    "phone": _PHONE_RE,
+    "email": _EMAIL_RE,
+    "postal_code": _POSTAL_RE,
+    "amount": _AMOUNT_RE,
+    "id_number": _ID_RE,
+}
+
+# Fields whose values have a stricter format than their type.
+_FIELD_PATTERNS: Dict[str, Pattern[str]] = {
+    "pan": _PAN_RE,
+    "aadhaar": _AADHAAR_RE,
+}
+
+# Free-standing values that are unambiguous without a label.
+_UNLABELED_PATTERNS: List[Tuple[str, str, Pattern[str]]] = [
+    ("email", "email", _EMAIL_RE),
+    ("pan", "id_number", _PAN_RE),
+    ("aadhaar", "id_number", _AADHAAR_RE),
+]
+
+FORM_FIELDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "name": ("text", ("name", "full name", "applicant name", "candidate name", "customer name")),
+    "father_name": ("text", ("father's name", "father name", "father/husband name")),
+    "date_of_birth": ("date", ("date of birth", "dob", "d.o.b", "birth date")),
+    "date": ("date", ("date", "dated")),
+    "phone": ("phone", ("phone", "phone no", "phone number", "mobile", "mobile no", "mobile number", "telephone", "contact no", "contact number")),
+    "email": ("email", ("email", "e-mail", "email id", "email address")),
+    "postal_code": ("postal_code", ("pin", "pin code", "pincode", "zip", "zip code", "postal code", "postcode")),
+    "address": ("text", ("address", "residential address", "permanent address")),
+    "amount": ("amount", ("amount", "total", "total amount", "sum", "fee", "amount paid")),
+    "pan": ("id_number", ("pan", "pan no", "pan number")),
+    "aadhaar": ("id_number", ("aadhaar", "aadhar", "aadhaar no", "aadhaar number", "uid")),
+    "id_number": ("id_number", ("id", "id no", "id number", "passport no", "passport number", "account no", "account number", "policy no", "policy number")),
+    "gender": ("text", ("gender", "sex")),
+    "signature": ("text", ("signature", "sign")),
+}
+
+
+class AhoCorasick:
+    """Multi-pattern matcher over lowercased text; yields the longest label ending at each position."""
+
+    def __init__(self, patterns: Dict[str, str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[Tuple[str, int]]] = [None]
+        for pattern, value in patterns.items():
+            self._add(pattern.lower(), value)
+        self._build()
+
+    def _add(self, pattern: str, value: str) -> None:
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            state = nxt
+        self._output[state] = (value, len(pattern))
+
+    def _build(self) -> None:
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                if self._output[nxt] is None:
+                    self._output[nxt] = self._output[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        state = 0
+        for index, char in enumerate(text.lower()):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            output = self._output[state]
+            if output is not None:
+                value, length = output
+                yield index - length + 1, index + 1, value
+
+
+_ALIASES = {alias: field for field, (_, aliases) in FORM_FIELDS.items() for alias in aliases}
+_LABEL_MATCHER = AhoCorasick(_ALIASES)
+_SEPARATOR_RE = re.compile(r"^\s*(?:[:=\-–]|\.{2,})\s*")
+
+
+def is_local_entities_enabled() -> bool:
+    return env_flag("AGUI_LOCAL_ENTITIES", True)
+
+
+@dataclass
+class LocalExtraction:
+    entities: List[Dict[str, Any]]
+    resolved_lines: List[str]
+    leftover_lines: List[str]
+
+    @property
+    def leftover_text(self) -> str:
+        return "\n".join(self.leftover_lines)
+
+
+def _is_word_boundary(line: str, start: int, end: int) -> bool:
+    before = line[start - 1] if start > 0 else " "
+    after = line[end] if end < len(line) else " "
+    return not before.isalnum() and not after.isalnum()
+
+
+def _find_labels(line: str) -> List[Tuple[int, int, str]]:
+    candidates = []
+    for start, end, field in _LABEL_MATCHER.iter_matches(line):
+        # A label must be a whole phrase followed by a separator to count.
+        if _is_word_boundary(line, start, end) and _SEPARATOR_RE.match(line[end:]):
+            candidates.append((start, end, field))
+    # Earliest first, longest at the same start; drop labels nested inside a chosen one.
+    candidates.sort(key=lambda match: (match[0], -match[1]))
+    labels: List[Tuple[int, int, str]] = []
+    for match in candidates:
+        if labels and match[0] < labels[-1][1]:
+            continue
+        labels.append(match)
+    return labels
+
+
+def _typed_value(field: str, field_type: str, value: str) -> Optional[str]:
+    pattern = _FIELD_PATTERNS.get(field) or _TYPE_PATTERNS.get(field_type)
+    if pattern is None:
+        return value or None
+    for match in pattern.finditer(value):
+        candidate = match.group(0).strip()
+        if field_type == "phone" and not 7 <= sum(char.isdigit() for char in candidate) <= 15:
+            continue
+        return candidate
+    return None
+
+
+def _resolve_line(line: str) -> Optional[List[Dict[str, Any]]]:
+    """Entities for a line made up only of ``label: value`` pairs, or None if any part is ambiguous."""
+    labels = _find_labels(line)
+    # Text before the first label ("Mother's Name", "Nominee Name") qualifies it; leave that to the LLM.
+    if not labels or labels[0][0] != 0:
+        return None
+
+    entities = []
+    for index, (start, end, field) in enumerate(labels):
+        segment_end = labels[index + 1][0] if index + 1 < len(labels) else len(line)
+        segment = _SEPARATOR_RE.sub("", line[end:segment_end], count=1).strip().rstrip(",;")
+        field_type = FORM_FIELDS[field][0]
+        value = _typed_value(field, field_type, segment)
+        # The value has to account for the whole segment, otherwise something was left unparsed.
+        if not value or value != segment:
+            return None
+        entities.append({
+            "key": field,
+            "label": line[start:end],
+            "value": value,
+            "type": field_type,
+            "source": "local",
+        })
+    return entities
+
+
+def extract_entities(raw_text: str) -> LocalExtraction:
+    entities: List[Dict[str, Any]] = []
+    resolved: List[str] = []
+    leftover: List[str] = []
+    for raw_line in raw_text.splitlines():
+        line = " ".join(raw_line.split())
+        if not line:
+            continue
+
+        line_entities = _resolve_line(line)
+        if line_entities:
+            entities.extend(line_entities)
+            resolved.append(line)
+            continue
+
+        # Pick up unambiguous values, but leave the line for the LLM to resolve the rest.
+        for field, field_type, pattern in _UNLABELED_PATTERNS:
+            for match in pattern.finditer(line):
+                entities.append({"key": field, "value": match.group(0), "type": field_type, "source": "local"})
+        leftover.append(line)
+
+    return LocalExtraction(entities=entities, resolved_lines=resolved, leftover_lines=leftover)
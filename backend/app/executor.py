@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ManagedPool:
+    """Bounded executor wrapper that applies backpressure and tracks queue depth."""
+
+    def __init__(self, name: str, workers: int, max_queue: int, use_processes: bool = False):
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "waiting": 0,
+            "max_waiting": 0,
+            "total_wait_seconds": 0.0,
+            "total_run_seconds": 0.0,
+        }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"agui-{self.name}")
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Work admitted to the executor is capped at workers + max_queue; further callers wait here.
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers + self.max_queue)
+        return self._slots
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        slots = self._get_slots()
+        self._stats["waiting"] += 1
+        self._stats["max_waiting"] = max(self._stats["max_waiting"], self._stats["waiting"])
+        wait_started = time.perf_counter()
+        try:
+            await slots.acquire()
+        finally:
+            self._stats["waiting"] -= 1
+        self._stats["total_wait_seconds"] += time.perf_counter() - wait_started
+
+        self._stats["submitted"] += 1
+        self._stats["in_flight"] += 1
+        run_started = time.perf_counter()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), functools.partial(func, *args, **kwargs)
+            )
+        except BaseException:
+            self._stats["failed"] += 1
+            raise
+        else:
+            self._stats["completed"] += 1
+            return result
+        finally:
+            self._stats["in_flight"] -= 1
+            self._stats["total_run_seconds"] += time.perf_counter() - run_started
+            slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self._stats["completed"] + self._stats["failed"]
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "processes": self.use_processes,
+            **self._stats,
+            "queue_depth": max(0, self._stats["in_flight"] - self.workers) + self._stats["waiting"],
+            "avg_wait_seconds": self._stats["total_wait_seconds"] / self._stats["submitted"] if self._stats["submitted"] else 0.0,
+            "avg_run_seconds": self._stats["total_run_seconds"] / finished if finished else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.last_lag = max(0.0, loop.time() - expected)
+            self.max_lag = max(self.max_lag, self.last_lag)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> Dict[str, float]:
+        return {"last_lag_seconds": self.last_lag, "max_lag_seconds": self.max_lag}
+
+
+_cpu_processes = int(os.environ.get("AGUI_CPU_PROCESSES", "0"))
+
+io_pool = ManagedPool(
+    "io",
+    workers=int(os.environ.get("AGUI_IO_THREADS", "8")),
+    max_queue=int(os.environ.get("AGUI_IO_MAX_QUEUE", "64")),
+)
+cpu_pool = ManagedPool(
+    "cpu",
+    workers=_cpu_processes or int(os.environ.get("AGUI_CPU_THREADS", "4")),
+    max_queue=int(os.environ.get("AGUI_CPU_MAX_QUEUE", "32")),
+    use_processes=_cpu_processes > 0,
+)
+loop_lag_monitor = LoopLagMonitor()
+
+
+async def run_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    return await io_pool.run(func, *args, **kwargs)
+
+
+async def run_cpu(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    return await cpu_pool.run(func, *args, **kwargs)
+
+
+def get_executor_stats() -> Dict[str, Any]:
+    return {"pools": [io_pool.stats(), cpu_pool.stats()], "event_loop": loop_lag_monitor.stats()}
+
+
+def shutdown_pools() -> None:
+    loop_lag_monitor.stop()
+    io_pool.shutdown()
+    cpu_pool.shutdown()
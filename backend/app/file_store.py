@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import re
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import uuid4
 
 from fastapi import UploadFile
 
+from .blob_store import prune_blobs
+from .executor import run_io
+
 UPLOAD_DIR = Path(os.environ.get("AGUI_UPLOAD_DIR", Path(__file__).resolve().parent / "uploads"))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -25,6 +32,14 @@ ALLOWED_CONTENT_TYPES = {
 
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".tif", ".tiff", ".pdf"}
 
+UPLOAD_MAX_AGE_SECONDS = float(os.environ.get("AGUI_UPLOAD_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+UPLOAD_MAX_TOTAL_BYTES = int(os.environ.get("AGUI_UPLOAD_MAX_TOTAL_BYTES", str(5 * 1024 ** 3)))
+UPLOAD_MAX_SHARD_BYTES = int(os.environ.get("AGUI_UPLOAD_MAX_SHARD_BYTES", "0"))
+UPLOAD_JANITOR_INTERVAL_SECONDS = float(os.environ.get("AGUI_UPLOAD_JANITOR_INTERVAL_SECONDS", "600"))
+
+_FILE_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_migration_lock = threading.Lock()
+
 
 @dataclass
 class UploadRecord:
@@ -48,10 +63,62 @@ def _safe_extension(filename: str) -> str:
     return Path(filename).suffix.lower()
 
 
+def _shard_dir(file_id: str) -> Path:
+    # Two levels of 256 buckets keep every directory small as the store grows.
+    return UPLOAD_DIR / file_id[:2] / file_id[2:4]
+
+
 def _metadata_path(file_id: str) -> Path:
+    return _shard_dir(file_id) / f"{file_id}.json"
+
+
+def _legacy_metadata_path(file_id: str) -> Path:
     return UPLOAD_DIR / f"{file_id}.json"
 
 
+def _touch(path: Path) -> None:
+    # The metadata file's mtime doubles as the last-access time for LRU eviction.
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _migrate_legacy_upload(file_id: str) -> Optional[Path]:
+    # get_upload and the janitor can race on the same upload from different io-pool threads.
+    with _migration_lock:
+        meta_path = _metadata_path(file_id)
+        if meta_path.exists():
+            return meta_path
+        legacy_meta = _legacy_metadata_path(file_id)
+        if not legacy_meta.exists():
+            return None
+        payload = json.loads(legacy_meta.read_text())
+        shard_dir = _shard_dir(file_id)
+        shard_dir.mkdir(parents=True, exist_ok=True)
+
+        legacy_path = Path(payload["path"])
+        target_path = shard_dir / legacy_path.name
+        if not legacy_path.exists():
+            legacy_path = UPLOAD_DIR / legacy_path.name
+        if legacy_path.exists():
+            os.replace(legacy_path, target_path)
+        if target_path.exists():
+            payload["path"] = str(target_path)
+
+        meta_path.write_text(json.dumps(payload, indent=2))
+        legacy_meta.unlink(missing_ok=True)
+        return meta_path
+
+
+def migrate_legacy_uploads() -> int:
+    migrated = 0
+    for legacy_meta in UPLOAD_DIR.glob("*.json"):
+        if _FILE_ID_RE.match(legacy_meta.stem) and _migrate_legacy_upload(legacy_meta.stem):
+            migrated += 1
+    return migrated
+
+
 def save_upload(file: UploadFile) -> UploadRecord:
     filename = file.filename or "uploaded-file"
     extension = _safe_extension(filename)
@@ -62,7 +129,9 @@ def save_upload(file: UploadFile) -> UploadRecord:
 
     file_id = uuid4().hex
     target_extension = extension if extension else ".bin"
-    target_path = UPLOAD_DIR / f"{file_id}{target_extension}"
+    shard_dir = _shard_dir(file_id)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    target_path = shard_dir / f"{file_id}{target_extension}"
 
     data = file.file.read()
     target_path.write_bytes(data)
@@ -80,13 +149,18 @@ def save_upload(file: UploadFile) -> UploadRecord:
 
 
 def get_upload(file_id: str) -> Optional[UploadRecord]:
+    if not isinstance(file_id, str) or not _FILE_ID_RE.match(file_id):
+        return None
     meta_path = _metadata_path(file_id)
     if not meta_path.exists():
-        return None
+        meta_path = _migrate_legacy_upload(file_id)
+        if meta_path is None:
+            return None
     payload = json.loads(meta_path.read_text())
     path = Path(payload["path"])
     if not path.exists():
         return None
+    _touch(meta_path)
     return UploadRecord(
         file_id=payload["file_id"],
         filename=payload["filename"],
@@ -94,3 +168,99 @@ def get_upload(file_id: str) -> Optional[UploadRecord]:
         size=int(payload["size"]),
         path=path,
     )
+
+
+def _delete_upload(entry: Dict) -> None:
+    entry["data_path"].unlink(missing_ok=True)
+    entry["meta_path"].unlink(missing_ok=True)
+
+
+def _scan_uploads() -> List[Dict]:
+    entries = []
+    for meta_path in UPLOAD_DIR.glob("*/*/*.json"):
+        file_id = meta_path.stem
+        if not _FILE_ID_RE.match(file_id):
+            continue
+        data_paths = [path for path in meta_path.parent.glob(f"{file_id}.*") if path != meta_path]
+        try:
+            meta_stat = meta_path.stat()
+            data_stat = data_paths[0].stat() if data_paths else None
+        except OSError:
+            continue
+        entries.append({
+            "file_id": file_id,
+            "shard": meta_path.parent.parent.name,
+            "meta_path": meta_path,
+            "data_path": data_paths[0] if data_paths else meta_path,
+            "size": (data_stat.st_size if data_stat else 0) + meta_stat.st_size,
+            "created_at": data_stat.st_mtime if data_stat else meta_stat.st_mtime,
+            "last_access": meta_stat.st_mtime,
+        })
+    return entries
+
+
+def run_janitor_pass(now: Optional[float] = None) -> Dict[str, int]:
+    """Migrate flat uploads, then apply age, per-shard and total-size retention."""
+    now = time.time() if now is None else now
+    stats = {"migrated": migrate_legacy_uploads(), "expired": 0, "evicted": 0, "remaining": 0, "bytes": 0}
+
+    live = []
+    for entry in _scan_uploads():
+        if UPLOAD_MAX_AGE_SECONDS > 0 and now - entry["created_at"] > UPLOAD_MAX_AGE_SECONDS:
+            _delete_upload(entry)
+            stats["expired"] += 1
+        else:
+            live.append(entry)
+
+    # Least recently accessed first, so eviction below keeps hot uploads.
+    live.sort(key=lambda entry: entry["last_access"])
+
+    if UPLOAD_MAX_SHARD_BYTES > 0:
+        shard_bytes: Dict[str, int] = {}
+        for entry in live:
+            shard_bytes[entry["shard"]] = shard_bytes.get(entry["shard"], 0) + entry["size"]
+        kept = []
+        for entry in live:
+            if shard_bytes[entry["shard"]] > UPLOAD_MAX_SHARD_BYTES:
+                _delete_upload(entry)
+                shard_bytes[entry["shard"]] -= entry["size"]
+                stats["evicted"] += 1
+            else:
+                kept.append(entry)
+        live = kept
+
+    total_bytes = sum(entry["size"] for entry in live)
+    if UPLOAD_MAX_TOTAL_BYTES > 0:
+        kept = []
+        for entry in live:
+            if total_bytes > UPLOAD_MAX_TOTAL_BYTES:
+                _delete_upload(entry)
+                total_bytes -= entry["size"]
+                stats["evicted"] += 1
+            else:
+                kept.append(entry)
+        live = kept
+
+    stats["remaining"] = len(live)
+    stats["bytes"] = total_bytes
+    stats["blobs_pruned"] = prune_blobs(UPLOAD_MAX_AGE_SECONDS, now)
+    return stats
+
+
+async def janitor_loop(interval: float = UPLOAD_JANITOR_INTERVAL_SECONDS) -> None:
+    while True:
+        try:
+            stats = await run_io(run_janitor_pass)
+            if stats["migrated"] or stats["expired"] or stats["evicted"] or stats["blobs_pruned"]:
+                print("Upload janitor pass:", stats)
+        except Exception as exc:  # pylint: disable=broad-except
+            print("Upload janitor pass failed:", exc)
+        await asyncio.sleep(interval)
+
+
+async def asave_upload(file: UploadFile) -> UploadRecord:
+    return await run_io(save_upload, file)
+
+
+async def aget_upload(file_id: str) -> Optional[UploadRecord]:
+    return await run_io(get_upload, file_id)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class QualityThresholds:
+    min_blur_score: float
+    max_skew_angle: float
+    max_lighting_variance: float
+    unreadable_blur_score: float
+    unreadable_issue_markers: Tuple[str, ...]
+
+
+def get_quality_thresholds() -> QualityThresholds:
+    return QualityThresholds(
+        min_blur_score=float(os.environ.get("AGUI_QUALITY_MIN_BLUR", "100")),
+        max_skew_angle=float(os.environ.get("AGUI_QUALITY_MAX_SKEW", "2.0")),
+        max_lighting_variance=float(os.environ.get("AGUI_QUALITY_MAX_LIGHTING_VARIANCE", "2500")),
+        # Fail-fast is opt-in: these scores are LLM estimates whose scale is not guaranteed, and issue
+        # text like "a few words are illegible" does not mean the whole page is.
+        unreadable_blur_score=float(os.environ.get("AGUI_QUALITY_UNREADABLE_BLUR", "0")),
+        unreadable_issue_markers=tuple(
+            marker.strip().lower()
+            for marker in os.environ.get("AGUI_QUALITY_UNREADABLE_MARKERS", "").split(",")
+            if marker.strip()
+        ),
+    )
+
+
+def unreadable_reason(quality: dict, thresholds: Optional[QualityThresholds] = None) -> Optional[str]:
+    thresholds = thresholds or get_quality_thresholds()
+    if thresholds.unreadable_blur_score > 0 and float(quality.get("blur_score") or 0.0) < thresholds.unreadable_blur_score:
+        return "Document is too blurred to read"
+    for issue in quality.get("issues") or []:
+        if isinstance(issue, str) and any(marker in issue.lower() for marker in thresholds.unreadable_issue_markers):
+            return f"Document is unreadable: {issue}"
+    return None
+
+
+def plan_after_quality(quality: dict, thresholds: Optional[QualityThresholds] = None) -> str:
+    """Pick the next file stage: enhance, preprocess, or straight to extraction."""
+    thresholds = thresholds or get_quality_thresholds()
+    needs_enhance = (
+        float(quality.get("blur_score") or 0.0) < thresholds.min_blur_score
+        or abs(float(quality.get("skew_angle") or 0.0)) > thresholds.max_skew_angle
+        or float(quality.get("lighting_variance") or 0.0) > thresholds.max_lighting_variance
+    )
+    if needs_enhance:
+        return "file_enhance"
+    if quality.get("issues"):
+        return "file_preprocess"
+    return "file_extract"
@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import hashlib
 import json
 from typing import Optional
 from langgraph.graph import StateGraph, END, START
@@ -8,16 +9,44 @@ from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.runnables import RunnableConfig
 from ag_ui_langgraph.types import CustomEventNames
 
+from ..agent_calls import run_agent
 from ..schemas.state import AgentState
-from ..agents.summarizer import summarizer_agent
-from ..agents.translator import translator_agent
+from ..agents.summarizer import (
+    SUMMARIZER_INSTRUCTIONS,
+    SUMMARIZER_MODEL_NAME,
+    chunk_summarizer_agent,
+    get_chunk_tokens,
+    get_long_input_tokens,
+    get_small_summarizer_agent,
+    get_small_summarizer_model_name,
+    get_summary_parallelism,
+    summarizer_agent,
+    summary_reduce_agent,
+)
+from ..agents.translator import TRANSLATOR_INSTRUCTIONS, TRANSLATOR_MODEL_NAME, translator_agent
 from ..agents.counter import counter_agent
+from ..agents.cascade import (
+    get_ground_cascade_threshold,
+    get_summary_cascade_threshold,
+    grounding_cascade_stats,
+    is_ground_cascade_enabled,
+    rule_based_ground,
+    score_summary,
+    summary_cascade_stats,
+)
 from ..agents.grounder import get_grounding_agent
 from ..agents.file_quality import get_quality_agent
 from ..agents.file_enhance import get_enhance_agent
 from ..agents.file_preprocess import get_preprocess_agent
 from ..agents.file_extract import get_extract_agent
-from ..file_store import get_upload
+from ..agents.file_fused import get_fused_agent, get_fused_max_bytes, is_fused_mode_enabled
+from ..executor import run_cpu, run_io
+from ..blob_store import aexternalize, aresolve
+from ..entity_extractor import extract_entities, is_local_entities_enabled
+from ..file_store import aget_upload
+from ..response_cache import summary_cache, translation_cache
+from ..text_chunks import chunk_text, estimate_tokens
+from .quality_routing import plan_after_quality, unreadable_reason
 
 def _get_input_text(state: AgentState) -> str:
     input_text = state.get("input_text")
@@ -100,22 +129,100 @@ async def _emit_status(state: AgentState, config: RunnableConfig | None, status:
     # Give the event loop a moment so the stream can flush intermediate status updates.
     await asyncio.sleep(2.5)
 
-def _load_file_payload(record) -> dict:
-    data = record.path.read_bytes()
+def _encode_base64(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+def _hash_file_request(file_payload: dict, extra) -> str:
+    digest = hashlib.sha256()
+    digest.update(file_payload["content_type"].encode("utf-8"))
+    digest.update(file_payload["base64"].encode("ascii"))
+    digest.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+async def _file_dedupe_key(file_payload: dict, extra=None) -> str:
+    # Identify file requests by document content, not upload id, so identical shared forms coalesce.
+    return await run_cpu(_hash_file_request, file_payload, extra)
+
+async def _load_file_payload(record) -> dict:
+    data = await run_io(record.path.read_bytes)
     return {
         "file_id": record.file_id,
         "filename": record.filename,
         "content_type": record.content_type,
         "size": record.size,
-        "base64": base64.b64encode(data).decode("utf-8"),
+        "base64": await run_cpu(_encode_base64, data),
+    }
+
+def _validate_fused_payload(payload) -> Optional[dict]:
+    if not isinstance(payload, dict):
+        return None
+    sections = ("quality", "preprocess", "extracted", "grounded")
+    if any(not isinstance(payload.get(section), dict) for section in sections):
+        return None
+    if not (payload["extracted"].get("raw_text") or "").strip():
+        return None
+    return payload
+
+async def file_fused_node(state: AgentState, config: RunnableConfig | None = None):
+    file_ref = _get_file_ref(state)
+    if not file_ref:
+        return {"file_errors": ["No file reference found"], "llm_status": "Completed"}
+
+    record = await aget_upload(file_ref["file_id"])
+    if not record:
+        return {"file_errors": ["Uploaded file not found"], "llm_status": "Completed"}
+
+    if record.size > get_fused_max_bytes():
+        return {"file_ref": file_ref, "file_mode": "staged"}
+
+    fused_agent = get_fused_agent()
+    if not fused_agent:
+        return {"file_ref": file_ref, "file_mode": "staged"}
+
+    await _emit_status(state, config, "Processing")
+    file_payload = await _load_file_payload(record)
+    try:
+        res = await run_agent(
+            fused_agent,
+            await run_cpu(json.dumps, file_payload),
+            stage="file_fused",
+            dedupe_key=await _file_dedupe_key(file_payload),
+        )
+        fused_data = res.data if hasattr(res, "data") else res
+    except Exception as exc:  # pylint: disable=broad-except
+        print("Fused file agent failed, falling back to staged pipeline:", exc)
+        return {"file_ref": file_ref, "file_mode": "staged"}
+
+    fused_payload = _validate_fused_payload(_model_dump(fused_data))
+    if not fused_payload:
+        print("Fused file output failed validation, falling back to staged pipeline")
+        return {"file_ref": file_ref, "file_mode": "staged"}
+
+    update = {
+        "file_ref": file_ref,
+        "file_mode": "fused",
+        "file_quality": fused_payload["quality"],
+        "enhanced_data": None,
+        "preprocess_data": fused_payload["preprocess"],
+        "extracted_data": await aexternalize(fused_payload["extracted"]),
+        "grounded_data": await aexternalize(fused_payload["grounded"]),
     }
+    state.update(update)
+    await _emit_status(state, config, "Completed")
+    return {**update, "llm_status": "Completed"}
+
+_FILE_STAGE_STATUS = {
+    "file_enhance": "Enhancing",
+    "file_preprocess": "Preprocessing",
+    "file_extract": "Extracting",
+}
 
 async def file_quality_node(state: AgentState, config: RunnableConfig | None = None):
     file_ref = _get_file_ref(state)
     if not file_ref:
         return {"file_errors": ["No file reference found"], "llm_status": "Completed"}
 
-    record = get_upload(file_ref["file_id"])
+    record = await aget_upload(file_ref["file_id"])
     if not record:
         return {"file_errors": ["Uploaded file not found"], "llm_status": "Completed"}
 
@@ -124,9 +231,14 @@ async def file_quality_node(state: AgentState, config: RunnableConfig | None = N
     if not quality_agent:
         return {"file_errors": ["Vertex AI credentials not configured for quality assessment"], "llm_status": "Completed"}
 
-    file_payload = _load_file_payload(record)
+    file_payload = await _load_file_payload(record)
     try:
-        res = await quality_agent.run(json.dumps(file_payload))
+        res = await run_agent(
+            quality_agent,
+            await run_cpu(json.dumps, file_payload),
+            stage="file_quality",
+            dedupe_key=await _file_dedupe_key(file_payload),
+        )
         quality_data = res.data if hasattr(res, "data") else res
     except Exception as exc:  # pylint: disable=broad-except
         return {"file_errors": [f"Quality agent failed: {exc}"], "llm_status": "Completed"}
@@ -136,6 +248,10 @@ async def file_quality_node(state: AgentState, config: RunnableConfig | None = N
     elif isinstance(quality_data, dict):
         quality_payload = quality_data
     else:
+        quality_payload = None
+
+    if quality_payload is None:
+        # Without a usable assessment, run every stage.
         quality_payload = {
             "blur_score": 0.0,
             "skew_angle": 0.0,
@@ -143,18 +259,30 @@ async def file_quality_node(state: AgentState, config: RunnableConfig | None = N
             "issues": ["Unable to parse quality output"],
             "image_count": 0,
         }
-
-    state["file_ref"] = file_ref
-    state["file_quality"] = quality_payload
-    await _emit_status(state, config, "Enhancing")
-    return {"file_ref": file_ref, "file_quality": quality_payload, "llm_status": "Enhancing"}
+        file_route = "file_enhance"
+    else:
+        reason = unreadable_reason(quality_payload)
+        if reason:
+            return {"file_ref": file_ref, "file_quality": quality_payload, "file_errors": [reason], "llm_status": "Completed"}
+        file_route = plan_after_quality(quality_payload)
+
+    status = _FILE_STAGE_STATUS[file_route]
+    update = {"file_ref": file_ref, "file_quality": quality_payload, "file_route": file_route}
+    # Skipped stages must not leave a previous document's output on the thread.
+    if file_route != "file_enhance":
+        update["enhanced_data"] = None
+    if file_route == "file_extract":
+        update["preprocess_data"] = None
+    state.update(update)
+    await _emit_status(state, config, status)
+    return {**update, "llm_status": status}
 
 async def file_enhance_node(state: AgentState, config: RunnableConfig | None = None):
     file_ref = state.get("file_ref") or _get_file_ref(state)
     if not file_ref:
         return {"file_errors": ["No file reference found"], "llm_status": "Completed"}
 
-    record = get_upload(file_ref["file_id"])
+    record = await aget_upload(file_ref["file_id"])
     if not record:
         return {"file_errors": ["Uploaded file not found"], "llm_status": "Completed"}
 
@@ -162,14 +290,21 @@ async def file_enhance_node(state: AgentState, config: RunnableConfig | None = N
     if not enhance_agent:
         return {"file_errors": ["Vertex AI credentials not configured for enhancement"], "llm_status": "Completed"}
 
-    file_payload = _load_file_payload(record)
+    file_payload = await _load_file_payload(record)
     quality_payload = state.get("file_quality")
     request_payload = {
         "file": file_payload,
         "quality": quality_payload,
     }
     try:
-        res = await enhance_agent.run(json.dumps(request_payload))
+        res = await run_agent(
+            enhance_agent,
+            await run_cpu(json.dumps, request_payload),
+            stage="file_enhance",
+            dedupe_key=await _file_dedupe_key(
+                request_payload["file"], {key: value for key, value in request_payload.items() if key != "file"}
+            ),
+        )
         enhance_data = res.data if hasattr(res, "data") else res
     except Exception as exc:  # pylint: disable=broad-except
         return {"file_errors": [f"Enhancement agent failed: {exc}"], "llm_status": "Completed"}
@@ -181,6 +316,7 @@ async def file_enhance_node(state: AgentState, config: RunnableConfig | None = N
     else:
         enhance_payload = {"instructions": "Unable to parse enhancement output", "enhanced_base64": None}
 
+    enhance_payload = await aexternalize(enhance_payload)
     state["enhanced_data"] = enhance_payload
     await _emit_status(state, config, "Preprocessing")
     return {"enhanced_data": enhance_payload, "llm_status": "Preprocessing"}
@@ -190,7 +326,7 @@ async def file_preprocess_node(state: AgentState, config: RunnableConfig | None
     if not file_ref:
         return {"file_errors": ["No file reference found"], "llm_status": "Completed"}
 
-    record = get_upload(file_ref["file_id"])
+    record = await aget_upload(file_ref["file_id"])
     if not record:
         return {"file_errors": ["Uploaded file not found"], "llm_status": "Completed"}
 
@@ -198,13 +334,23 @@ async def file_preprocess_node(state: AgentState, config: RunnableConfig | None
     if not preprocess_agent:
         return {"file_errors": ["Vertex AI credentials not configured for preprocessing"], "llm_status": "Completed"}
 
-    enhance_payload = state.get("enhanced_data")
+    try:
+        enhance_payload = await aresolve(state.get("enhanced_data"))
+    except (KeyError, OSError, ValueError) as exc:
+        return {"file_errors": [f"Enhancement data unavailable: {exc}"], "llm_status": "Completed"}
     request_payload = {
-        "file": _load_file_payload(record),
+        "file": await _load_file_payload(record),
         "enhancement": enhance_payload,
     }
     try:
-        res = await preprocess_agent.run(json.dumps(request_payload))
+        res = await run_agent(
+            preprocess_agent,
+            await run_cpu(json.dumps, request_payload),
+            stage="file_preprocess",
+            dedupe_key=await _file_dedupe_key(
+                request_payload["file"], {key: value for key, value in request_payload.items() if key != "file"}
+            ),
+        )
         preprocess_data = res.data if hasattr(res, "data") else res
     except Exception as exc:  # pylint: disable=broad-except
         return {"file_errors": [f"Preprocess agent failed: {exc}"], "llm_status": "Completed"}
@@ -225,7 +371,7 @@ async def file_extract_node(state: AgentState, config: RunnableConfig | None = N
     if not file_ref:
         return {"file_errors": ["No file reference found"], "llm_status": "Completed"}
 
-    record = get_upload(file_ref["file_id"])
+    record = await aget_upload(file_ref["file_id"])
     if not record:
         return {"file_errors": ["Uploaded file not found"], "llm_status": "Completed"}
 
@@ -233,13 +379,24 @@ async def file_extract_node(state: AgentState, config: RunnableConfig | None = N
     if not extract_agent:
         return {"file_errors": ["Vertex AI credentials not configured for extraction"], "llm_status": "Completed"}
 
+    try:
+        enhance_payload = await aresolve(state.get("enhanced_data"))
+    except (KeyError, OSError, ValueError) as exc:
+        return {"file_errors": [f"Enhancement data unavailable: {exc}"], "llm_status": "Completed"}
     request_payload = {
-        "file": _load_file_payload(record),
+        "file": await _load_file_payload(record),
         "preprocess": state.get("preprocess_data"),
-        "enhancement": state.get("enhanced_data"),
+        "enhancement": enhance_payload,
     }
     try:
-        res = await extract_agent.run(json.dumps(request_payload))
+        res = await run_agent(
+            extract_agent,
+            await run_cpu(json.dumps, request_payload),
+            stage="file_extract",
+            dedupe_key=await _file_dedupe_key(
+                request_payload["file"], {key: value for key, value in request_payload.items() if key != "file"}
+            ),
+        )
         extract_data = res.data if hasattr(res, "data") else res
     except Exception as exc:  # pylint: disable=broad-except
         return {"file_errors": [f"Extract agent failed: {exc}"], "llm_status": "Completed"}
@@ -251,29 +408,81 @@ async def file_extract_node(state: AgentState, config: RunnableConfig | None = N
     else:
         extract_payload = {"raw_text": str(extract_data), "page_count": 0}
 
+    extract_payload = await aexternalize(extract_payload)
     state["extracted_data"] = extract_payload
     await _emit_status(state, config, "Grounding")
     return {"extracted_data": extract_payload, "llm_status": "Grounding"}
 
+def _merge_local_grounding(local, grounded_payload: dict) -> dict:
+    if local is None or not local.entities:
+        return grounded_payload
+    # Only drop remote entities that repeat a locally extracted value; a shared key is not a duplicate.
+    local_values = {" ".join(str(entity["value"]).lower().split()) for entity in local.entities}
+    remote_entities = [
+        entity for entity in grounded_payload.get("entities") or []
+        if not (
+            isinstance(entity, dict)
+            and " ".join(str(entity.get("value", "")).lower().split()) in local_values
+        )
+    ]
+    normalized_parts = list(local.resolved_lines)
+    if grounded_payload.get("normalized_text"):
+        normalized_parts.append(grounded_payload["normalized_text"])
+    notes = f"{len(local.entities)} field(s) extracted locally."
+    if grounded_payload.get("notes"):
+        notes = f"{notes} {grounded_payload['notes']}"
+    return {
+        "normalized_text": "\n".join(normalized_parts),
+        "entities": local.entities + remote_entities,
+        "notes": notes,
+    }
+
+async def _finish_grounding(state: AgentState, config: RunnableConfig | None, grounded_payload: dict):
+    grounded_payload = await aexternalize(grounded_payload)
+    state["grounded_data"] = grounded_payload
+    await _emit_status(state, config, "Completed")
+    return {"grounded_data": grounded_payload, "llm_status": "Completed"}
+
 async def file_ground_node(state: AgentState, config: RunnableConfig | None = None):
-    extracted = state.get("extracted_data") or {}
+    try:
+        extracted = await aresolve(state.get("extracted_data") or {})
+    except (KeyError, OSError, ValueError) as exc:
+        return {"file_errors": [f"Extracted data unavailable: {exc}"], "llm_status": "Completed"}
     raw_text = ""
     if isinstance(extracted, dict):
         raw_text = extracted.get("raw_text") or ""
 
+    local = extract_entities(raw_text) if is_local_entities_enabled() else None
+    if local is not None and local.entities:
+        # The LLM only sees the lines the local extractor could not resolve.
+        remaining_text = local.leftover_text
+    else:
+        local = None
+        remaining_text = raw_text
+
+    if local is not None and not remaining_text:
+        grounded_payload = _merge_local_grounding(local, {"normalized_text": "", "entities": [], "notes": None})
+        return await _finish_grounding(state, config, grounded_payload)
+
+    if is_ground_cascade_enabled():
+        local_payload, confidence = rule_based_ground(remaining_text)
+        accepted = bool(local_payload["entities"]) and confidence >= get_ground_cascade_threshold()
+        grounding_cascade_stats.record(confidence, accepted)
+        if accepted:
+            grounded_payload = _merge_local_grounding(local, local_payload)
+            return await _finish_grounding(state, config, grounded_payload)
+
     grounding_agent = get_grounding_agent()
     if not grounding_agent:
-        grounded_payload = {
-            "normalized_text": raw_text,
+        grounded_payload = _merge_local_grounding(local, {
+            "normalized_text": remaining_text,
             "entities": [],
             "notes": "Gemini 2.5 Flash not configured; returning raw extraction.",
-        }
-        state["grounded_data"] = grounded_payload
-        await _emit_status(state, config, "Completed")
-        return {"grounded_data": grounded_payload, "llm_status": "Completed"}
+        })
+        return await _finish_grounding(state, config, grounded_payload)
 
     try:
-        res = await grounding_agent.run(raw_text or "")
+        res = await run_agent(grounding_agent, remaining_text or "", stage="file_ground")
         if hasattr(res, "data"):
             grounded = res.data
         elif hasattr(res, "output"):
@@ -282,7 +491,7 @@ async def file_ground_node(state: AgentState, config: RunnableConfig | None = No
             grounded = res
     except Exception as exc:  # pylint: disable=broad-except
         grounded = {
-            "normalized_text": raw_text,
+            "normalized_text": remaining_text,
             "entities": [],
             "notes": f"Grounding failed: {exc}",
         }
@@ -294,18 +503,24 @@ async def file_ground_node(state: AgentState, config: RunnableConfig | None = No
     else:
         grounded_payload = {"normalized_text": str(grounded), "entities": [], "notes": None}
 
-    state["grounded_data"] = grounded_payload
-    await _emit_status(state, config, "Completed")
-    return {"grounded_data": grounded_payload, "llm_status": "Completed"}
+    return await _finish_grounding(state, config, _merge_local_grounding(local, grounded_payload))
 
 def _route_input(state: AgentState) -> str:
     if _get_file_ref(state):
-        return "file"
+        return "file_fused" if is_fused_mode_enabled() else "file"
     return "text"
 
+def _route_file_after_fused(state: AgentState) -> str:
+    errors = state.get("file_errors") or []
+    if errors:
+        return "file_error"
+    return "done" if state.get("file_mode") == "fused" else "file_quality"
+
 def _route_file_after_quality(state: AgentState) -> str:
     errors = state.get("file_errors") or []
-    return "file_error" if errors else "file_enhance"
+    if errors:
+        return "file_error"
+    return state.get("file_route") or "file_enhance"
 
 def _route_file_after_enhance(state: AgentState) -> str:
     errors = state.get("file_errors") or []
@@ -319,6 +534,93 @@ def _route_file_after_extract(state: AgentState) -> str:
     errors = state.get("file_errors") or []
     return "file_error" if errors else "file_ground"
 
+def _result_output(res):
+    if hasattr(res, "data"):
+        return res.data
+    if hasattr(res, "output"):
+        return res.output
+    return res
+
+def _merge_key_points(*groups) -> list:
+    merged = []
+    seen = set()
+    for group in groups:
+        for point in group or []:
+            if not isinstance(point, str):
+                continue
+            key = " ".join(point.lower().split())
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(point.strip())
+    return merged
+
+async def _summarize_chunks(chunks: list) -> tuple:
+    semaphore = asyncio.Semaphore(get_summary_parallelism())
+
+    degraded = False
+
+    async def _summarize_chunk(chunk: str) -> dict:
+        nonlocal degraded
+        async with semaphore:
+            try:
+                chunk_summary = _model_dump(_result_output(await run_agent(chunk_summarizer_agent, chunk, stage="summarize_chunk")))
+            except Exception as exc:  # pylint: disable=broad-except
+                print("Chunk summarizer failed, keeping excerpt:", exc)
+                chunk_summary = None
+        if isinstance(chunk_summary, str):
+            return {"summary": _clean_summary_text(chunk_summary), "key_points": []}
+        if isinstance(chunk_summary, dict) and "summary" in chunk_summary:
+            return chunk_summary
+        degraded = True
+        return {"summary": " ".join(chunk.split()[:60]), "key_points": []}
+
+    summaries = await asyncio.gather(*(_summarize_chunk(chunk) for chunk in chunks))
+    return summaries, degraded
+
+async def _summarize_long_text(input_text: str, depth: int = 0) -> tuple:
+    """Map-reduce summary of ``input_text``; the flag is True if any step fell back to excerpts."""
+    chunks = await run_cpu(chunk_text, input_text, get_chunk_tokens())
+    chunk_summaries, degraded = await _summarize_chunks(chunks)
+    merged_points = _merge_key_points(*(item.get("key_points") for item in chunk_summaries))
+    partial_summaries = [item.get("summary") or "" for item in chunk_summaries]
+    combined = "\n\n".join(partial_summaries)
+
+    # Partial summaries of very long inputs can still overflow the context; reduce them hierarchically.
+    if estimate_tokens(combined) > get_long_input_tokens() and depth < 3:
+        reduced, reduce_degraded = await _summarize_long_text(combined, depth + 1)
+        summary = {"summary": reduced["summary"], "key_points": _merge_key_points(reduced["key_points"], merged_points)}
+        return summary, degraded or reduce_degraded
+
+    reduce_prompt = json.dumps({"partial_summaries": partial_summaries, "key_points": merged_points})
+    try:
+        reduced = _model_dump(_result_output(await run_agent(summary_reduce_agent, reduce_prompt, stage="summarize_reduce")))
+    except Exception as exc:  # pylint: disable=broad-except
+        print("Summary reduce failed, joining partial summaries:", exc)
+        reduced = None
+    if isinstance(reduced, dict) and reduced.get("summary"):
+        summary = {"summary": reduced["summary"], "key_points": _merge_key_points(reduced.get("key_points"), merged_points)}
+        return summary, degraded
+    return {"summary": _clean_summary_text(combined), "key_points": merged_points}, True
+
+async def _summarize_with_cascade(input_text: str) -> tuple:
+    """Summary from the cheapest tier that passes validation, with the model name that produced it."""
+    small_agent = get_small_summarizer_agent()
+    if small_agent:
+        try:
+            draft = _result_output(await run_agent(small_agent, input_text, stage="summarize_small"))
+        except Exception as exc:  # pylint: disable=broad-except
+            print("Small summarizer failed, escalating:", exc)
+            draft = None
+        if isinstance(draft, str):
+            confidence = score_summary(input_text, _clean_summary_text(draft))
+            accepted = confidence >= get_summary_cascade_threshold()
+            summary_cascade_stats.record(confidence, accepted)
+            if accepted:
+                return draft, get_small_summarizer_model_name()
+        else:
+            summary_cascade_stats.record(0.0, False)
+    return _result_output(await run_agent(summarizer_agent, input_text, stage="summarize")), SUMMARIZER_MODEL_NAME
+
 async def summarize_node(state: AgentState, config: RunnableConfig | None = None):
     input_text = _get_input_text(state)
     if not input_text:
@@ -327,24 +629,38 @@ async def summarize_node(state: AgentState, config: RunnableConfig | None = None
     await _emit_status(state, config, "Processing")
     await _emit_status(state, config, "Thinking")
     await _emit_status(state, config, "Summarizing")
-    try:
-        res = await summarizer_agent.run(input_text)
-        if hasattr(res, "data"):
-            summary = res.data
-        elif hasattr(res, "output"):
-            summary = res.output
+    # Each tier caches under its own model name, so a small-model draft is never served as llama3.1 output.
+    cache_models = [SUMMARIZER_MODEL_NAME]
+    if get_small_summarizer_model_name():
+        cache_models.append(get_small_summarizer_model_name())
+    summary_payload = None
+    for cache_model in cache_models:
+        summary_payload = summary_cache.get(input_text, cache_model, SUMMARIZER_INSTRUCTIONS)
+        if summary_payload is not None:
+            break
+    if summary_payload is None:
+        cacheable = True
+        summary_model = SUMMARIZER_MODEL_NAME
+        try:
+            if estimate_tokens(input_text) > get_long_input_tokens():
+                summary, degraded = await _summarize_long_text(input_text)
+                # Excerpt fallbacks must not be cached as if the model had produced them.
+                cacheable = not degraded
+            else:
+                summary, summary_model = await _summarize_with_cascade(input_text)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Fallback to a naive summary to keep the graph running
+            print("Summarizer failed, falling back to naive summary:", exc)
+            summary = {"summary": input_text[:300], "key_points": []}
+            cacheable = False
+        if isinstance(summary, str):
+            summary_payload = {"summary": _clean_summary_text(summary), "key_points": []}
+        elif isinstance(summary, dict) and "summary" in summary:
+            summary_payload = summary
         else:
-            summary = res
-    except Exception as exc:  # pylint: disable=broad-except
-        # Fallback to a naive summary to keep the graph running
-        print("Summarizer failed, falling back to naive summary:", exc)
-        summary = {"summary": input_text[:300], "key_points": []}
-    if isinstance(summary, str):
-        summary_payload = {"summary": _clean_summary_text(summary), "key_points": []}
-    elif isinstance(summary, dict) and "summary" in summary:
-        summary_payload = summary
-    else:
-        summary_payload = _model_dump(summary)
+            summary_payload = _model_dump(summary)
+        if cacheable and isinstance(summary_payload, dict):
+            summary_cache.put(input_text, summary_model, SUMMARIZER_INSTRUCTIONS, summary_payload)
     state["summary_data"] = summary_payload
     await _emit_status(state, config, "Thinking")
     return {"summary_data": summary_payload, "llm_status": "Thinking"}
@@ -375,30 +691,37 @@ async def translate_node(state: AgentState, config: RunnableConfig | None = None
         summary_text = getattr(summary_data, "summary", None)
     input_text = _get_input_text(state)
     text_to_translate = _clean_summary_text(summary_text or input_text or "")
-    try:
-        res = await translator_agent.run(text_to_translate)
-        if hasattr(res, "data"):
-            translated = res.data
-        elif hasattr(res, "output"):
-            translated = res.output
+    translated_payload = translation_cache.get(text_to_translate, TRANSLATOR_MODEL_NAME, TRANSLATOR_INSTRUCTIONS)
+    if translated_payload is None:
+        cacheable = True
+        try:
+            res = await run_agent(translator_agent, text_to_translate, stage="translate")
+            if hasattr(res, "data"):
+                translated = res.data
+            elif hasattr(res, "output"):
+                translated = res.output
+            else:
+                translated = res
+        except Exception as exc:  # pylint: disable=broad-except
+            print("Translator failed, falling back to original summary:", exc)
+            translated = text_to_translate
+            cacheable = False
+
+        if isinstance(translated, str):
+            translated_payload = {"translated_text": _clean_summary_text(translated)}
+        elif isinstance(translated, dict) and "translated_text" in translated:
+            translated_payload = translated
         else:
-            translated = res
-    except Exception as exc:  # pylint: disable=broad-except
-        print("Translator failed, falling back to original summary:", exc)
-        translated = text_to_translate
-
-    if isinstance(translated, str):
-        translated_payload = {"translated_text": _clean_summary_text(translated)}
-    elif isinstance(translated, dict) and "translated_text" in translated:
-        translated_payload = translated
-    else:
-        translated_payload = {"translated_text": _clean_summary_text(str(translated))}
+            translated_payload = {"translated_text": _clean_summary_text(str(translated))}
+        if cacheable:
+            translation_cache.put(text_to_translate, TRANSLATOR_MODEL_NAME, TRANSLATOR_INSTRUCTIONS, translated_payload)
 
     state["translated_data"] = translated_payload
     await _emit_status(state, config, "Thinking")
     return {"translated_data": translated_payload, "llm_status": "Thinking"}
 
 workflow = StateGraph(AgentState)
+workflow.add_node("file_fused", file_fused_node)
 workflow.add_node("file_quality", file_quality_node)
 workflow.add_node("file_enhance", file_enhance_node)
 workflow.add_node("file_preprocess", file_preprocess_node)
@@ -407,8 +730,26 @@ workflow.add_node("file_ground", file_ground_node)
 workflow.add_node("summarizer", summarize_node)
 workflow.add_node("translate", translate_node)
 workflow.add_node("counter", count_node)
-workflow.add_conditional_edges(START, _route_input, {"file": "file_quality", "text": "summarizer"})
-workflow.add_conditional_edges("file_quality", _route_file_after_quality, {"file_enhance": "file_enhance", "file_error": END})
+workflow.add_conditional_edges(
+    START,
+    _route_input,
+    {"file_fused": "file_fused", "file": "file_quality", "text": "summarizer"},
+)
+workflow.add_conditional_edges(
+    "file_fused",
+    _route_file_after_fused,
+    {"file_quality": "file_quality", "done": END, "file_error": END},
+)
+workflow.add_conditional_edges(
+    "file_quality",
+    _route_file_after_quality,
+    {
+        "file_enhance": "file_enhance",
+        "file_preprocess": "file_preprocess",
+        "file_extract": "file_extract",
+        "file_error": END,
+    },
+)
 workflow.add_conditional_edges("file_enhance", _route_file_after_enhance, {"file_preprocess": "file_preprocess", "file_error": END})
 workflow.add_conditional_edges("file_preprocess", _route_file_after_preprocess, {"file_extract": "file_extract", "file_error": END})
 workflow.add_conditional_edges("file_extract", _route_file_after_extract, {"file_ground": "file_ground", "file_error": END})
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 # Note the specific integration path for the endpoint
@@ -5,7 +7,14 @@ from copilotkit.integrations.fastapi import add_fastapi_endpoint
 from copilotkit import Action, CopilotKitRemoteEndpoint, LangGraphAGUIAgent
 from ag_ui_langgraph import add_langgraph_fastapi_endpoint
 from .graph.workflow import graph
-from .file_store import save_upload
+from .agent_calls import get_hedge_stats, get_single_flight_stats
+from .agents.cascade import get_cascade_stats
+from .blob_store import aresolve
+from .executor import get_executor_stats, loop_lag_monitor, shutdown_pools
+from .file_store import asave_upload, janitor_loop
+from .response_cache import get_cache_stats
+from .run_context import CancelOnDisconnectMiddleware, get_run_stats
+from .scheduler import get_scheduler_stats
 # from ag_ui_langgraph import add_langgraph_fastapi_endpoint
 
 app = FastAPI()
@@ -25,6 +34,21 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CancelOnDisconnectMiddleware, paths=("/agui",))
+
+_background_tasks = []
+
+@app.on_event("startup")
+async def start_background_tasks():
+    loop_lag_monitor.start()
+    _background_tasks.append(asyncio.create_task(janitor_loop()))
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    shutdown_pools()
 
 # sdk = LangGraphAgent(
 #     name="ag-ui-agent",
@@ -80,7 +104,7 @@ add_langgraph_fastapi_endpoint(app, sdk, "/agui")
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     try:
-        record = save_upload(file)
+        record = await asave_upload(file)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:  # pylint: disable=broad-except
@@ -93,6 +117,50 @@ async def upload_file(file: UploadFile = File(...)):
         "size": record.size,
     }
 
+# Lazily resolve large state values that the graph stores out of band.
+@app.get("/blobs/{blob_id}")
+async def read_blob(blob_id: str, encoding: str = "text"):
+    try:
+        content = await aresolve({"blob_ref": blob_id, "encoding": encoding})
+    except (KeyError, OSError) as exc:
+        raise HTTPException(status_code=404, detail="Blob not found") from exc
+    return {"blob_ref": blob_id, "content": content}
+
+# Hit/miss counters for the summarize/translate response caches.
+@app.get("/cache-stats")
+async def cache_stats():
+    return {"caches": get_cache_stats()}
+
+# Local-first cascade acceptance and escalation rates.
+@app.get("/cascade-stats")
+async def cascade_stats():
+    return {"cascades": get_cascade_stats()}
+
+# Per-stage agent call counts, hedge rate and hedge win counts.
+@app.get("/hedge-stats")
+async def hedge_stats():
+    return {"stages": get_hedge_stats()}
+
+# LLM scheduler lane concurrency and queue-wait times.
+@app.get("/scheduler-stats")
+async def scheduler_stats():
+    return get_scheduler_stats()
+
+# Agent calls coalesced onto an identical in-flight call.
+@app.get("/single-flight-stats")
+async def single_flight_stats():
+    return get_single_flight_stats()
+
+# Runs cancelled on client disconnect or by the per-run deadline.
+@app.get("/run-stats")
+async def run_stats():
+    return get_run_stats()
+
+# Executor pool queue depth and event-loop lag.
+@app.get("/executor-stats")
+async def executor_stats():
+    return get_executor_stats()
+
 # Simple test endpoint to verify the graph/agents and Ollama connectivity.
 # POST JSON {"input_text": "..."} -> runs summarizer then counter and returns results.
 @app.post("/test-graph")
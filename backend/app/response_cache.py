@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .env_flags import env_flag
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def _shingles(self, normalized: str) -> Set[str]:
+        words = _WORD_RE.findall(normalized)
+        if len(words) < self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, normalized: str) -> Tuple[int, ...]:
+        hashes = [_hash64(shingle) for shingle in self._shingles(normalized)]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+    @staticmethod
+    def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        if not left or len(left) != len(right):
+            return 0.0
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+@dataclass
+class _CacheEntry:
+    namespace: str
+    value: Dict[str, Any]
+    expires_at: float
+    signature: Optional[Tuple[int, ...]] = None
+    bands: List[Tuple[str, int, int]] = field(default_factory=list)
+
+
+class ResponseCache:
+    """Two-tier (exact + MinHash/LSH near-duplicate) cache for agent responses."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        near_duplicate: bool = False,
+        similarity_threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.near_duplicate = near_duplicate
+        self.similarity_threshold = similarity_threshold
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._hasher = MinHasher(num_perm=num_perm)
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, int, int], Set[str]] = {}
+        self._stats = {"exact_hits": 0, "near_hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @staticmethod
+    def _namespace(model: str, instructions: str) -> str:
+        return hashlib.sha256(f"{model}\x00{instructions}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _key(namespace: str, normalized: str) -> str:
+        return hashlib.sha256(f"{namespace}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def _band_keys(self, namespace: str, signature: Tuple[int, ...]) -> List[Tuple[str, int, int]]:
+        return [
+            (namespace, band, hash(signature[band * self._rows:(band + 1) * self._rows]))
+            for band in range(self._bands)
+        ]
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        for band_key in entry.bands:
+            members = self._buckets.get(band_key)
+            if members is None:
+                continue
+            members.discard(key)
+            if not members:
+                del self._buckets[band_key]
+
+    def _live_entry(self, key: str, now: float) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            self._stats["expirations"] += 1
+            return None
+        return entry
+
+    def _lookup_near(self, namespace: str, signature: Tuple[int, ...], now: float) -> Optional[str]:
+        candidates: Set[str] = set()
+        for band_key in self._band_keys(namespace, signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        best_key, best_score = None, 0.0
+        for key in candidates:
+            entry = self._live_entry(key, now)
+            if entry is None or entry.signature is None:
+                continue
+            score = MinHasher.similarity(signature, entry.signature)
+            if score >= self.similarity_threshold and score > best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def get(self, text: str, model: str, instructions: str) -> Optional[Dict[str, Any]]:
+        if self.max_entries <= 0:
+            return None
+        now = time.monotonic()
+        namespace = self._namespace(model, instructions)
+        normalized = normalize_text(text)
+        key = self._key(namespace, normalized)
+
+        entry = self._live_entry(key, now)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._stats["exact_hits"] += 1
+            return dict(entry.value)
+
+        if self.near_duplicate:
+            near_key = self._lookup_near(namespace, self._hasher.signature(normalized), now)
+            if near_key is not None:
+                self._entries.move_to_end(near_key)
+                self._stats["near_hits"] += 1
+                return dict(self._entries[near_key].value)
+
+        self._stats["misses"] += 1
+        return None
+
+    def put(self, text: str, model: str, instructions: str, value: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        namespace = self._namespace(model, instructions)
+        normalized = normalize_text(text)
+        key = self._key(namespace, normalized)
+        self._remove(key)
+
+        entry = _CacheEntry(namespace=namespace, value=dict(value), expires_at=time.monotonic() + self.ttl_seconds)
+        if self.near_duplicate:
+            entry.signature = self._hasher.signature(normalized)
+            entry.bands = self._band_keys(namespace, entry.signature)
+            for band_key in entry.bands:
+                self._buckets.setdefault(band_key, set()).add(key)
+        self._entries[key] = entry
+
+        while len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["exact_hits"] + self._stats["near_hits"] + self._stats["misses"]
+        hits = self._stats["exact_hits"] + self._stats["near_hits"]
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "near_duplicate": self.near_duplicate,
+            **self._stats,
+            "lookups": lookups,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "exact_hit_rate": self._stats["exact_hits"] / lookups if lookups else 0.0,
+            "near_hit_rate": self._stats["near_hits"] / lookups if lookups else 0.0,
+        }
+
+
+def _build_cache(name: str) -> ResponseCache:
+    enabled = env_flag("AGUI_RESPONSE_CACHE", True)
+    return ResponseCache(
+        name,
+        max_entries=int(os.environ.get("AGUI_RESPONSE_CACHE_SIZE", "512")) if enabled else 0,
+        ttl_seconds=float(os.environ.get("AGUI_RESPONSE_CACHE_TTL", "3600")),
+        near_duplicate=env_flag("AGUI_RESPONSE_CACHE_NEAR_DUP", False),
+        similarity_threshold=float(os.environ.get("AGUI_RESPONSE_CACHE_SIMILARITY", "0.9")),
+    )
+
+
+summary_cache = _build_cache("summarizer")
+translation_cache = _build_cache("translator")
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    return [summary_cache.stats(), translation_cache.stats()]
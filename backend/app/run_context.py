@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import time
+from typing import Any, Dict, Iterable, Optional
+
+_run_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("agui_run_deadline", default=None)
+
+_run_stats = {"runs": 0, "cancelled_on_disconnect": 0, "deadline_exceeded": 0}
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    pass
+
+
+def get_run_deadline_seconds() -> float:
+    return float(os.environ.get("AGUI_RUN_DEADLINE_SECONDS", "0"))
+
+
+def start_run_deadline(seconds: Optional[float] = None) -> Optional[float]:
+    seconds = get_run_deadline_seconds() if seconds is None else seconds
+    deadline = time.monotonic() + seconds if seconds > 0 else None
+    _run_deadline.set(deadline)
+    return deadline
+
+
+def remaining_time() -> Optional[float]:
+    deadline = _run_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+async def run_within_deadline(awaitable, stage: str):
+    """Await ``awaitable`` with whatever is left of the run's deadline; fail fast once it is spent."""
+    remaining = remaining_time()
+    if remaining is None:
+        return await awaitable
+    if remaining <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        _run_stats["deadline_exceeded"] += 1
+        raise DeadlineExceeded(f"Run deadline exceeded before {stage}")
+    try:
+        return await asyncio.wait_for(awaitable, timeout=remaining)
+    except asyncio.TimeoutError as exc:
+        _run_stats["deadline_exceeded"] += 1
+        raise DeadlineExceeded(f"Run deadline exceeded during {stage}") from exc
+
+
+def get_run_stats() -> Dict[str, Any]:
+    return dict(_run_stats)
+
+
+class CancelOnDisconnectMiddleware:
+    """ASGI middleware that starts a per-run deadline and cancels the handler when the client goes away."""
+
+    def __init__(self, app, paths: Iterable[str] = ("/agui",)):
+        self.app = app
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope.get("path", "").startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        _run_stats["runs"] += 1
+        start_run_deadline()
+        messages: asyncio.Queue = asyncio.Queue()
+        handler = asyncio.ensure_future(self.app(scope, messages.get, send))
+
+        async def pump() -> None:
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if not handler.done():
+                        _run_stats["cancelled_on_disconnect"] += 1
+                        handler.cancel()
+                    return
+
+        listener = asyncio.ensure_future(pump())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not listener.done():
+                raise
+        finally:
+            listener.cancel()
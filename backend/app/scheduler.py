@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+LANE_INTERACTIVE_TEXT = "interactive_text"
+LANE_INTERACTIVE_FILE = "interactive_file"
+LANE_BACKGROUND = "background"
+
+# Highest priority first.
+LANES = (LANE_INTERACTIVE_TEXT, LANE_INTERACTIVE_FILE, LANE_BACKGROUND)
+
+_DEFAULT_LANE_LIMITS = {
+    LANE_INTERACTIVE_TEXT: 8,
+    LANE_INTERACTIVE_FILE: 6,
+    LANE_BACKGROUND: 2,
+}
+_WAIT_WINDOW = 500
+
+
+
+def get_bulk_prompt_chars() -> int:
+    return int(os.environ.get("AGUI_SCHED_BULK_PROMPT_CHARS", str(4 * 1024 * 1024)))
+
+
+def get_max_queue_wait() -> float:
+    return float(os.environ.get("AGUI_SCHED_MAX_QUEUE_WAIT_SECONDS", "30"))
+
+
+def lane_for_stage(stage: str, prompt_chars: int = 0) -> str:
+    if stage.startswith("file_"):
+        # Large multi-page documents are bulk work; they must not hold up quick interactive forms.
+        bulk_chars = get_bulk_prompt_chars()
+        if bulk_chars > 0 and prompt_chars > bulk_chars:
+            return LANE_BACKGROUND
+        return LANE_INTERACTIVE_FILE
+    # Map-side summary chunks stay interactive: a user is waiting on the reduced summary.
+    return LANE_INTERACTIVE_TEXT
+
+
+def get_lane_limit(lane: str) -> int:
+    return int(os.environ.get(f"AGUI_SCHED_{lane.upper()}_LIMIT", str(_DEFAULT_LANE_LIMITS[lane])))
+
+
+def get_max_concurrency() -> int:
+    return int(os.environ.get("AGUI_SCHED_MAX_CONCURRENCY", "12"))
+
+
+class _Lane:
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = max(1, limit)
+        self.in_flight = 0
+        self.virtual_time = 0.0
+        self.thread_finish: Dict[str, float] = {}
+        self.queue: List[Tuple[float, int, asyncio.Future, str, float]] = []
+        self.dispatched = 0
+        self.total_wait = 0.0
+        self.waits: Deque[float] = deque(maxlen=_WAIT_WINDOW)
+
+    def stats(self) -> Dict[str, Any]:
+        ordered = sorted(self.waits)
+        return {
+            "lane": self.name,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": sum(1 for entry in self.queue if not entry[2].done()),
+            "dispatched": self.dispatched,
+            "avg_wait_seconds": self.total_wait / self.dispatched if self.dispatched else 0.0,
+            "p95_wait_seconds": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0,
+            "max_wait_seconds": ordered[-1] if ordered else 0.0,
+        }
+
+
+class LLMScheduler:
+    """Strict priority between lanes with aging, weighted fair queuing between threads within a lane."""
+
+    def __init__(self, max_concurrency: int, lane_limits: Dict[str, int], max_queue_wait: float = 30.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue_wait = max_queue_wait
+        self._lanes = {lane: _Lane(lane, lane_limits[lane]) for lane in LANES}
+        self._in_flight = 0
+        self._sequence = itertools.count()
+
+    def _grant(self, lane: _Lane) -> bool:
+        finish, _, future, _, _ = heapq.heappop(lane.queue)
+        if future.done():
+            return False
+        lane.virtual_time = max(lane.virtual_time, finish)
+        lane.in_flight += 1
+        self._in_flight += 1
+        future.set_result(None)
+        return True
+
+    def _dispatch(self) -> None:
+        # Aging: a lane whose head has waited past max_queue_wait is served first, so lower lanes are never starved.
+        if self.max_queue_wait > 0:
+            deadline = time.perf_counter() - self.max_queue_wait
+            while self._in_flight < self.max_concurrency:
+                aged = [
+                    lane
+                    for lane in self._lanes.values()
+                    if lane.queue and lane.in_flight < lane.limit and lane.queue[0][4] < deadline
+                ]
+                if not aged:
+                    break
+                self._grant(min(aged, key=lambda lane: lane.queue[0][4]))
+        for lane in self._lanes.values():
+            while self._in_flight < self.max_concurrency and lane.in_flight < lane.limit and lane.queue:
+                self._grant(lane)
+
+    def _release(self, lane: _Lane) -> None:
+        lane.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, lane_name: str, thread_id: Optional[str] = None, cost: float = 1.0) -> AsyncIterator[None]:
+        lane = self._lanes.get(lane_name) or self._lanes[LANE_BACKGROUND]
+        thread = thread_id or "anonymous"
+        # WFQ finish tag: a thread's requests are spaced by their cost, so one busy thread cannot crowd out others.
+        start = max(lane.virtual_time, lane.thread_finish.get(thread, 0.0))
+        finish = start + max(cost, 0.01)
+        lane.thread_finish[thread] = finish
+
+        future = asyncio.get_running_loop().create_future()
+        queued_at = time.perf_counter()
+        heapq.heappush(lane.queue, (finish, next(self._sequence), future, thread, queued_at))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(lane)
+            raise
+
+        waited = time.perf_counter() - queued_at
+        lane.dispatched += 1
+        lane.total_wait += waited
+        lane.waits.append(waited)
+        if len(lane.thread_finish) > 1024:
+            lane.thread_finish = {key: value for key, value in lane.thread_finish.items() if value > lane.virtual_time}
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "lanes": [lane.stats() for lane in self._lanes.values()],
+        }
+
+
+scheduler = LLMScheduler(
+    get_max_concurrency(),
+    {lane: get_lane_limit(lane) for lane in LANES},
+    max_queue_wait=get_max_queue_wait(),
+)
+
+
+def get_scheduler_stats() -> Dict[str, Any]:
+    return scheduler.stats()
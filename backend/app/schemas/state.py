@@ -38,6 +38,12 @@ class GroundedOutput(BaseModel):
     entities: List[Dict[str, Any]] = Field(description="Extracted structured entities")
     notes: Optional[str] = Field(description="Grounding notes")
 
+class FusedFileOutput(BaseModel):
+    quality: FileQualityOutput = Field(description="Image quality assessment")
+    preprocess: PreprocessOutput = Field(description="Handwriting bounding box estimates")
+    extracted: ExtractedDataOutput = Field(description="Extracted handwriting text")
+    grounded: GroundedOutput = Field(description="Grounded/normalized text and entities")
+
 class AgentState(TypedDict):
     input_text: str
     messages: Optional[List[Dict[str, Any]]]
@@ -53,3 +59,5 @@ class AgentState(TypedDict):
     extracted_data: Optional[Dict[str, Any]]
     grounded_data: Optional[Dict[str, Any]]
     file_errors: Optional[List[str]]
+    file_mode: Optional[str]
+    file_route: Optional[str]
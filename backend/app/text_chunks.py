@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from typing import List
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n{2,}")
+
+
+def estimate_tokens(text: str) -> int:
+    # Rough llama-style estimate: ~4 characters per token, never below the word count.
+    return max(len(text.split()), (len(text) + 3) // 4)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in _SENTENCE_RE.split(text) if sentence and sentence.strip()]
+
+
+def _split_oversized(sentence: str, max_tokens: int) -> List[str]:
+    pieces: List[str] = []
+    current: List[str] = []
+    current_chars = 0
+    for word in sentence.split():
+        # Track the joined length incrementally; re-joining per word is quadratic on long unpunctuated text.
+        candidate_chars = current_chars + len(word) + (1 if current else 0)
+        candidate_tokens = max(len(current) + 1, (candidate_chars + 3) // 4)
+        if current and candidate_tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current, current_chars = [word], len(word)
+        else:
+            current.append(word)
+            current_chars = candidate_chars
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """Pack sentences into chunks of at most ``max_tokens`` estimated tokens."""
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence in split_sentences(text):
+        sentence_tokens = estimate_tokens(sentence)
+        if sentence_tokens > max_tokens:
+            if current:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            chunks.extend(_split_oversized(sentence, max_tokens))
+            continue
+        if current and current_tokens + sentence_tokens + 1 > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += sentence_tokens + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
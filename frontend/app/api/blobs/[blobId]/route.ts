@@ -0,0 +1,29 @@
+import { NextRequest } from "next/server";
+
+const AGUI_ENDPOINT = process.env.AGUI_ENDPOINT ?? "http://127.0.0.1:8001";
+
+export async function GET(req: NextRequest, { params }: { params: { blobId: string } }) {
+  const encoding = req.nextUrl.searchParams.get("encoding") ?? "text";
+  let upstream: Response;
+  try {
+    upstream = await fetch(
+      `${AGUI_ENDPOINT}/blobs/${encodeURIComponent(params.blobId)}?encoding=${encodeURIComponent(encoding)}`,
+    );
+  } catch (error) {
+    const message = error instanceof Error ? error.message : "Failed to reach blob service";
+    return new Response(JSON.stringify({ error: message, endpoint: AGUI_ENDPOINT }), {
+      status: 502,
+      headers: { "content-type": "application/json" },
+    });
+  }
+
+  const contentType = upstream.headers.get("content-type") ?? "application/json";
+  const body = await upstream.text();
+
+  return new Response(body, {
+    status: upstream.status,
+    headers: {
+      "content-type": contentType,
+    },
+  });
+}
@@ -33,14 +33,20 @@ type PreprocessData = {
   boxes_per_page: number[];
 };
 
+type BlobRef = {
+  blob_ref: string;
+  size: number;
+  encoding: "text" | "json";
+};
+
 type ExtractedData = {
-  raw_text: string;
+  raw_text: string | BlobRef;
   page_count: number;
 };
 
 type GroundedData = {
-  normalized_text: string;
-  entities: Array<Record<string, unknown>>;
+  normalized_text: string | BlobRef;
+  entities: Array<Record<string, unknown>> | BlobRef;
   notes?: string | null;
 };
 
@@ -58,6 +64,32 @@ type AgentState = {
   file_errors?: string[] | null;
 };
 
+// Large state values arrive as blob handles; fetch their content only when rendered.
+function useBlobText(value: string | BlobRef | null | undefined): string | null {
+  const [resolved, setResolved] = useState<{ ref: string; text: string } | null>(null);
+  const blobId = value && typeof value === "object" ? value.blob_ref : null;
+
+  useEffect(() => {
+    if (!blobId || resolved?.ref === blobId) return;
+    let cancelled = false;
+    fetch(`/api/blobs/${blobId}?encoding=text`)
+      .then((response) => (response.ok ? response.json() : null))
+      .then((payload) => {
+        if (!cancelled && payload && typeof payload.content === "string") {
+          setResolved({ ref: blobId, text: payload.content });
+        }
+      })
+      .catch(() => undefined);
+    return () => {
+      cancelled = true;
+    };
+  }, [blobId, resolved?.ref]);
+
+  if (typeof value === "string") return value;
+  if (blobId && resolved?.ref === blobId) return resolved.text;
+  return null;
+}
+
 function AgentUI() {
   const { appendMessage } = useCopilotChat();
   const { state, running, nodeName } = useCoAgent<AgentState>({
@@ -102,6 +134,8 @@ function AgentUI() {
   const preprocessData = state?.preprocess_data ?? null;
   const extractedData = state?.extracted_data ?? null;
   const groundedData = state?.grounded_data ?? null;
+  const extractedText = useBlobText(extractedData?.raw_text);
+  const groundedText = useBlobText(groundedData?.normalized_text);
   const fileErrors = state?.file_errors ?? null;
 
   const [statusWord, setStatusWord] = useState<string>("Idle");
@@ -283,8 +317,8 @@ function AgentUI() {
 
           <div className="summary-card">
             <p className="label">Handwriting Extraction</p>
-            <p className={`summary-text ${extractedData?.raw_text ? "" : "summary-empty"}`}>
-              {extractedData?.raw_text || "Awaiting extraction..."}
+            <p className={`summary-text ${extractedText ? "" : "summary-empty"}`}>
+              {extractedText || "Awaiting extraction..."}
             </p>
             {preprocessData && (
               <p className="summary-subtext">
@@ -295,8 +329,8 @@ function AgentUI() {
 
           <div className="summary-card">
             <p className="label">Grounded Output</p>
-            <p className={`summary-text ${groundedData?.normalized_text ? "" : "summary-empty"}`}>
-              {groundedData?.normalized_text || "Awaiting grounding..."}
+            <p className={`summary-text ${groundedText ? "" : "summary-empty"}`}>
+              {groundedText || "Awaiting grounding..."}
             </p>
             {groundedData?.notes && (
               <p className="summary-subtext">{groundedData.notes}</p>